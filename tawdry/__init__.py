@@ -1,6 +1,7 @@
-import collections.abc
+import functools
 import inspect
 import re
+import sys
 import typing
 import wsgiref.simple_server
 
@@ -46,35 +47,119 @@ def generate_sitemap(sitemap: typing.Mapping, prefix: list=None):
     if prefix is None:
         prefix = []
 
-    for segment, sub_segment in sitemap.items():
-        if isinstance(sub_segment, collections.abc.Mapping):
-            yield from generate_sitemap(sub_segment, prefix + [segment])
-        elif isinstance(sub_segment, collections.abc.Callable):
-            if segment:
-                prefix = prefix + [segment]
-            yield (prefix, sub_segment)
+    stack = [(sitemap, tuple(prefix))]
+    while stack:
+        mapping, current_prefix = stack.pop()
+        sub_mappings = []
+        for segment, sub_segment in mapping.items():
+            if isinstance(sub_segment, dict):
+                sub_mappings.append((sub_segment, current_prefix + (segment,)))
+            elif callable(sub_segment):
+                route = current_prefix
+                if segment:
+                    route = current_prefix + (segment,)
+                yield (list(route), sub_segment)
+            else:
+                raise ValueError('Invalid datatype for sitemap')
+        stack.extend(reversed(sub_mappings))
+
+
+class TrieNode:
+    """A single node of the segment trie.
+
+    Slotted to keep the node a fixed, compact record — the closest
+    pure-Python equivalent of a C-level struct for the dispatcher's inner
+    loop.
+    """
+
+    __slots__ = ('children', 'param_name', 'param_child', 'controller')
+
+    def __init__(self):
+        self.children = {}
+        self.param_name = None
+        self.param_child = None
+        self.controller = None
+
+
+def get_segment_keyword(segment):
+    """Return the param name for a `{param}` segment, or None for a literal.
+
+    Param-ness is decided here, once, while routes are being compiled; no
+    request-time code inspects segment strings.
+    """
+    match = _SEGMENT_RE.fullmatch(segment)
+    if match is None:
+        return None
+    return match.group(1)
+
+
+def add_trie_route(trie, route_template, controller):
+    """Insert a single route into the segment trie rooted at `trie`.
+
+    Literal segments become keys in `children`; a `{param}` segment becomes
+    the node's single param child. The route's controller is stored on the
+    terminal node.
+    """
+    node = trie
+    for segment in route_template:
+        if not segment:
+            continue
+
+        name = get_segment_keyword(segment)
+        if name is not None:
+            if node.param_child is None:
+                child = TrieNode()
+                node.param_name = name
+                node.param_child = child
+            elif node.param_name == name:
+                child = node.param_child
+            else:
+                raise ValueError(
+                    'Conflicting parameter segments {{{}}} and {{{}}}'.format(
+                        node.param_name, name,
+                    )
+                )
         else:
-            raise ValueError('Invalid datatype for sitemap')
+            # Interned keys let the lookup in the dispatcher hit the dict's
+            # identity fast path for segments CPython interns on its own.
+            segment = sys.intern(segment)
+            child = node.children.get(segment)
+            if child is None:
+                child = TrieNode()
+                node.children[segment] = child
+        node = child
+    node.controller = controller
+
+
+_SEGMENT_RE = re.compile(r'\{(\w+)\}')
+_PARAM_VALUE_RE = re.compile(r'\w+')
+
+
+def _maybe_escape(section, _safe=re.compile(r'[A-Za-z0-9/_\-]*').fullmatch):
+    """Escape a literal url section, skipping sections that need no escaping."""
+    if _safe(section):
+        return section
+    return re.escape(section)
 
 
 def compile_route_regex(template):
     template = '/'.join(template)
-    segment_regex = r'\{(\w+)\}'
     regex = ['^']
     last_position = 0
-    for match in re.finditer(segment_regex, template):
-        escaped_section = re.escape(template[last_position:match.start()])
+    for match in _SEGMENT_RE.finditer(template):
+        escaped_section = _maybe_escape(template[last_position:match.start()])
         kwarg_name = match.group(1)
 
         regex.append(escaped_section)
         regex.append('(?P<{}>\w+)'.format(kwarg_name))
         last_position = match.end()
-    regex.append(re.escape(template[last_position:]))
+    regex.append(_maybe_escape(template[last_position:]))
     regex.append('$')
     result = ''.join(regex)
     return result
 
 
+@functools.lru_cache(maxsize=None)
 def get_parameter_mappings(callable):
     result = {}
     sig = inspect.signature(callable)
@@ -83,41 +168,69 @@ def get_parameter_mappings(callable):
     return result
 
 
-def map_params(mappings, context):
-    result = {}
-    for name, value in context.items():
-        mapping = mappings[name]
-        if mapping == inspect.Signature.empty:
-            result[name] = value
-            continue
-        result[name] = mapping(value)
-    return result
+def get_parameter_converters(callable):
+    """Reduce a callable's parameter annotations to a conversion table.
+
+    Returns a tuple of `(name, converter)` pairs for parameters carrying a
+    real annotation, or `None` when the callable has none and conversion can
+    be skipped outright.
+    """
+    converters = tuple(
+        (name, annotation)
+        for name, annotation in get_parameter_mappings(callable).items()
+        if annotation is not inspect.Signature.empty
+    )
+    return converters or None
 
 
 def get_route_response(sitemap, route_template, request):
+    program = compile_route_program(sitemap, route_template)
+    return run_route_program(program, request)
+
+
+def compile_route_program(sitemap, route_template):
+    """Flatten the sitemap walk for one route into a static program.
+
+    Resolves, once, which segments bind a keyword and which segments trigger
+    a view callable, so executing the route never needs to inspect the
+    sitemap or the segment strings. Steps are `(keyword or None, callable or
+    None, converters or None)`, with converters precomputed by
+    `get_parameter_converters`.
+    """
     route_template = iter(route_template)
     next(route_template)
 
-    url_context = {}
+    program = []
     sitemap_context = sitemap
     for segment in route_template:
-        keyword = None
-        if segment.startswith('{') and segment.endswith('}'):
-            keyword = segment[1:-1]
-            url_context[keyword] = request.urlvars[keyword]
+        keyword = get_segment_keyword(segment)
 
         resource_callable = None
         sitemap_context = sitemap_context[segment]
-
-        if isinstance(sitemap_context, collections.abc.Callable):
+        if callable(sitemap_context):
             if segment:
                 resource_callable = sitemap_context
         elif '' in sitemap_context:
             resource_callable = sitemap_context['']
 
-        if resource_callable:
-            param_mappings = get_parameter_mappings(resource_callable)
-            url_context = map_params(param_mappings, url_context)
+        converters = None
+        if resource_callable is not None:
+            converters = get_parameter_converters(resource_callable)
+        program.append((keyword, resource_callable, converters))
+    return tuple(program)
+
+
+def run_route_program(program, request):
+    url_context = {}
+    for keyword, resource_callable, converters in program:
+        if keyword is not None:
+            url_context[keyword] = request.urlvars[keyword]
+
+        if resource_callable is not None:
+            if converters is not None:
+                for name, converter in converters:
+                    if name in url_context:
+                        url_context[name] = converter(url_context[name])
             response = resource_callable(request, **url_context)
 
             if keyword:
@@ -125,6 +238,7 @@ def get_route_response(sitemap, route_template, request):
     return response
 
 
+@functools.lru_cache(maxsize=None)
 def get_callable_return_type(callable):
     signature = inspect.signature(callable)
     return_type = signature.return_annotation
@@ -135,22 +249,89 @@ def get_callable_return_type(callable):
 
 def inject_wsgi_types(request_type, response_type, base_exc_type):
     def make_route_response(sitemap, route_template, callable, conversion_type=mappers.Response):
-        def replacement(env, start_response):
-            request = request_type(env)
-            try:
-                response = get_route_response(sitemap, route_template, request)
-            except base_exc_type as e:
-                response = e
-            else:
-                response = conversion.get(response)
-            return response(env, start_response)
+        """Generate a controller specialized to one route.
 
+        The route's program (view callables, keyword bindings, parameter
+        converters) is fully known at construction, so rather than
+        interpreting it per request, emit straight-line source for exactly
+        this route and `exec` it into a function.
+        """
+        program = compile_route_program(sitemap, route_template)
         return_type = get_callable_return_type(callable)
         if return_type:
             conversion_type = return_type
         conversion = conversion_type(response_type)
 
-        return replacement
+        namespace = {
+            '_request_type': request_type,
+            '_base_exc_type': base_exc_type,
+            '_conversion': conversion,
+        }
+
+        body = []
+        if any(keyword for keyword, _, _ in program):
+            body.append('urlvars = request.urlvars')
+
+        context_names = []
+        for index, (keyword, resource_callable, converters) in enumerate(program):
+            if keyword is not None:
+                body.append('v_{0} = urlvars[{0!r}]'.format(keyword))
+                context_names.append(keyword)
+
+            if resource_callable is None:
+                continue
+
+            if converters is not None:
+                for name, converter in converters:
+                    if name not in context_names:
+                        continue
+                    converter_name = '_convert{}_{}'.format(index, name)
+                    namespace[converter_name] = converter
+                    body.append(
+                        'v_{0} = {1}(v_{0})'.format(name, converter_name)
+                    )
+
+            call_name = '_call{}'.format(index)
+            namespace[call_name] = resource_callable
+            kwargs = ''.join(
+                ', {0}=v_{0}'.format(name) for name in context_names
+            )
+            body.append('response = {}(request{})'.format(call_name, kwargs))
+            if keyword:
+                body.append('v_{} = response'.format(keyword))
+
+        if not body:
+            # A route with no program (e.g. a bare root-level '' key) has no
+            # view to call; serve a clean 404 rather than generating an empty
+            # try block.
+            namespace['_not_found'] = webob.exc.HTTPNotFound
+            lines = [
+                'def controller(env, start_response):',
+                '    return _not_found()(env, start_response)',
+            ]
+            source = '\n'.join(lines)
+            filename = '<tawdry route {}>'.format('/'.join(route_template))
+            exec(compile(source, filename, 'exec'), namespace)
+            return namespace['controller']
+
+        lines = [
+            'def controller(env, start_response):',
+            '    request = _request_type(env)',
+            '    try:',
+        ]
+        lines.extend('        ' + line for line in body)
+        lines.extend([
+            '    except _base_exc_type as e:',
+            '        response = e',
+            '    else:',
+            '        response = _conversion.get(response)',
+            '    return response(env, start_response)',
+        ])
+
+        source = '\n'.join(lines)
+        filename = '<tawdry route {}>'.format('/'.join(route_template))
+        exec(compile(source, filename, 'exec'), namespace)
+        return namespace['controller']
     return make_route_response
 
 
@@ -180,20 +361,93 @@ class Tawdry():
         )
         generated_sitemap = generate_sitemap(sitemap, [prefix])
 
-        self._routes = []
-        for route_template, callable in generated_sitemap:
-            compiled_route = compile_route_regex(route_template)
+        self._trie = TrieNode()
+        route_controllers = {}
+        branch_patterns = []
+        for index, (route_template, callable) in enumerate(generated_sitemap):
             controller = make_route_response(sitemap, route_template, callable)
-            self._routes.append((compiled_route, controller))
+            add_trie_route(self._trie, route_template, controller)
+
+            group = '_r{}'.format(index)
+            route_regex = re.sub(
+                r'\(\?P<(\w+)>',
+                lambda match: '(?P<{}_{}>'.format(group, match.group(1)),
+                compile_route_regex(route_template),
+            )
+            branch_patterns.append('(?P<{}>{})'.format(group, route_regex))
+            route_controllers[group] = controller
+
+        if branch_patterns:
+            self._route_matcher = re.compile('|'.join(branch_patterns))
+        else:
+            self._route_matcher = None
+
+        # Parallel arrays indexed by capture-group index, so a hit resolves
+        # to its controller and params in one step off of `match.lastindex`.
+        size = self._route_matcher.groups + 1 if self._route_matcher else 0
+        self._group_controllers = [None] * size
+        self._group_params = [None] * size
+        if self._route_matcher is not None:
+            groupindex = self._route_matcher.groupindex
+            for group, controller in route_controllers.items():
+                prefix = group + '_'
+                params = tuple(
+                    (name[len(prefix):], index)
+                    for name, index in groupindex.items()
+                    if name.startswith(prefix)
+                )
+                for index in (groupindex[group],) + tuple(i for _, i in params):
+                    self._group_controllers[index] = controller
+                    self._group_params[index] = params
 
     def __call__(self, env, start_response):
-        request = self.request_type(env)
-        for regex, controller in self._routes:
-            match = re.match(regex, request.path_info)
-            if match:
-                request.urlvars = match.groupdict()
-                return controller(env, start_response)
-        return webob.exc.HTTPNotFound()(env, start_response)
+        path = env.get('PATH_INFO', '/')
+
+        matched = self._match_trie(path)
+        if matched is None:
+            matched = self._match_regex(path)
+        if matched is None:
+            return webob.exc.HTTPNotFound()(env, start_response)
+
+        controller, urlvars = matched
+        env['wsgiorg.routing_args'] = ((), urlvars)
+        return controller(env, start_response)
+
+    def _match_trie(self, path):
+        path = path.strip('/')
+
+        urlvars = {}
+        node = self._trie
+        if path:
+            for segment in path.split('/'):
+                child = node.children.get(segment)
+                if child is None:
+                    child = node.param_child
+                    if child is None or not _PARAM_VALUE_RE.fullmatch(segment):
+                        return None
+                    urlvars[node.param_name] = segment
+                node = child
+
+        controller = node.controller
+        if controller is None:
+            return None
+        return controller, urlvars
+
+    def _match_regex(self, path):
+        if self._route_matcher is None:
+            return None
+
+        match = self._route_matcher.match(path)
+        if match is None:
+            return None
+
+        index = match.lastindex
+        controller = self._group_controllers[index]
+        urlvars = {
+            name: match.group(group_index)
+            for name, group_index in self._group_params[index]
+        }
+        return controller, urlvars
 
     def serve(self, make_server=wsgiref.simple_server.make_server, host='127.0.0.1', port=5000):
         httpd = make_server(host, port, self)
@@ -1,9 +1,10 @@
 import collections.abc
-import functools
 import json
 
 
 class TypingMeta(type):
+    _param_cache = {}
+
     def __init__(self, *args, **kwargs):
         pass
 
@@ -20,41 +21,47 @@ class TypingMeta(type):
             return True
         return False
 
-    @functools.lru_cache(typed=True)
     def __getitem__(self, *params):
         assert len(params) == 1
-        return self.__class__(
+        key = (self, params)
+        cached = self._param_cache.get(key)
+        if cached is not None:
+            return cached
+
+        result = self.__class__(
             self.__name__,
             self.__bases__,
             dict(self.__dict__),
             *params,
         )
+        self._param_cache[key] = result
+        return result
 
     def __repr__(self):
         return '{}[{}]'.format(super().__repr__(), self.__param__)
 
 
 class Response(metaclass=TypingMeta):
+    content_type = 'text/html'
+
     def __init__(self, response_type):
         self._response_type = response_type
 
-    def _create_response(self, result):
-        return self._response_type(body=result)
-
-    def _set_content_type(self, response):
-        response.headers.add('Content-type', 'text/html')
-
     def get(self, result):
-        response = self._create_response(result)
-        self._set_content_type(response)
-        return response
+        if not isinstance(result, bytes):
+            result = str(result).encode('utf-8')
+        # The charset rides inside the content type; passing charset=
+        # separately gets dropped by webob for non-text types like json.
+        return self._response_type(
+            body=result,
+            content_type='{}; charset=utf-8'.format(self.content_type),
+        )
 
 
 class JsonResponse(Response):
     __param__ = type(None)
 
-    def _set_content_type(self, response):
-        response.headers.add('Content-type', 'application/json')
+    content_type = 'application/json'
 
     def get(self, result):
         assert isinstance(result, self.__param__)
@@ -65,8 +72,7 @@ class JsonResponse(Response):
 class XmlResponse(Response):
     __param__ = type(None)
 
-    def _set_content_type(self, response):
-        response.headers.add('Content-type', 'application/xml')
+    content_type = 'application/xml'
 
     @staticmethod
     def convert_to_xml(map, root_node='objects'):
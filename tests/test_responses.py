@@ -50,6 +50,9 @@ def test_get_publisher():
     request = webob.Request.blank('/publisher/4')
     response = request.get_response(tawdry)
     assert response.body == b'Mad Hat'
+    assert response.headers.getall('Content-Type') == [
+        'text/html; charset=utf-8',
+    ]
 
 
 def test_get_author():
@@ -61,6 +64,9 @@ def test_get_author():
         b'<publisher name="Harambe"/>'
         b'</objects>'
     )
+    assert response.headers.getall('Content-Type') == [
+        'application/xml; charset=utf-8',
+    ]
 
 
 def test_get_book():
@@ -74,3 +80,6 @@ def test_get_book():
         b'"version": 1.0'
         b'}'
     )
+    assert response.headers.getall('Content-Type') == [
+        'application/json; charset=utf-8',
+    ]
@@ -1,5 +1,97 @@
+import pytest
+import webob
+
 from tawdry import Tawdry
 
 
+def literal(request):
+    return 'literal'
+
+
+def param(request, value):
+    return 'param ' + value
+
+
+dispatch_sitemap = {
+    'literal': literal,
+    'entry': {
+        '{value}': param,
+    },
+}
+
+
 def test_instantiation():
     Tawdry({})
+
+
+def test_literal_route():
+    tawdry = Tawdry(dispatch_sitemap)
+    response = webob.Request.blank('/literal').get_response(tawdry)
+    assert response.status_int == 200
+    assert response.body == b'literal'
+
+
+def test_param_route():
+    tawdry = Tawdry(dispatch_sitemap)
+    response = webob.Request.blank('/entry/4').get_response(tawdry)
+    assert response.status_int == 200
+    assert response.body == b'param 4'
+
+
+def test_unknown_route():
+    tawdry = Tawdry(dispatch_sitemap)
+    response = webob.Request.blank('/missing').get_response(tawdry)
+    assert response.status_int == 404
+
+
+def test_non_word_param_segment():
+    tawdry = Tawdry(dispatch_sitemap)
+    response = webob.Request.blank('/entry/4.5').get_response(tawdry)
+    assert response.status_int == 404
+
+
+def shadowed(request):
+    return 'shadowed'
+
+
+def fallback(request, x):
+    return 'fallback ' + x
+
+
+def test_regex_fallback_when_trie_commits_to_literal():
+    tawdry = Tawdry({
+        'a': {'b': shadowed},
+        '{x}': {'c': fallback},
+    })
+    response = webob.Request.blank('/a/c').get_response(tawdry)
+    assert response.status_int == 200
+    assert response.body == b'fallback a'
+
+
+def sibling_a(request):
+    return 'sibling a'
+
+
+def sibling_b(request):
+    return 'sibling b'
+
+
+def test_sibling_callables_both_route():
+    tawdry = Tawdry({'x': {'a': sibling_a, 'b': sibling_b}})
+    response = webob.Request.blank('/x/a').get_response(tawdry)
+    assert response.body == b'sibling a'
+    response = webob.Request.blank('/x/b').get_response(tawdry)
+    assert response.body == b'sibling b'
+
+
+def first(request, a):
+    return 'first'
+
+
+def second(request, b):
+    return 'second'
+
+
+def test_conflicting_param_segments():
+    with pytest.raises(ValueError):
+        Tawdry({'{a}': first, '{b}': second})